@@ -13,6 +13,7 @@ function getEnv() {
     ELEVENLABS_API_KEY: process.env.ELEVENLABS_API_KEY,
     ELEVENLABS_VOICE_ID: process.env.ELEVENLABS_VOICE_ID,
     ELEVENLABS_MODEL_ID: process.env.ELEVENLABS_MODEL_ID,
+    ELEVENLABS_CONCURRENCY: process.env.ELEVENLABS_CONCURRENCY,
     OPENAI_API_KEY: process.env.OPENAI_API_KEY,
     OPENAI_MODEL: process.env.OPENAI_MODEL,
     GOOGLE_OAUTH_CLIENT_ID: process.env.GOOGLE_OAUTH_CLIENT_ID,
@@ -10,6 +10,9 @@ interface CalendarEvent {
   meeting_link?: string;
 }
 
+// Shared stand-in for a missing start/end so events without one don't allocate
+const NO_TIME: { dateTime?: string; date?: string } = Object.freeze({});
+
 interface Env {
   GOOGLE_TOKEN_BASE64?: string;
   GOOGLE_OAUTH_CLIENT_ID?: string;
@@ -50,32 +53,20 @@ export async function getCalendarEvents(
     const items = data.items || [];
 
     const events: CalendarEvent[] = items.map((e: any) => {
-      const start = e.start || {};
-      const end = e.end || {};
-      const startIso = start.dateTime || `${start.date}T00:00:00`;
-      const endIso = end.dateTime || `${end.date}T00:00:00`;
-      const allDay = !start.dateTime;
+      const start = e.start || NO_TIME;
+      const end = e.end || NO_TIME;
+      const startDateTime = start.dateTime;
+      const endDateTime = end.dateTime;
 
-      let meetingLink: string | undefined;
-      const hangoutLink = e.hangoutLink;
-      if (hangoutLink) {
-        meetingLink = hangoutLink;
-      } else {
-        const conference = e.conferenceData?.entryPoints || [];
-        for (const ep of conference) {
-          if (ep.uri) {
-            meetingLink = ep.uri;
-            break;
-          }
-        }
-      }
+      const meetingLink: string | undefined =
+        e.hangoutLink || e.conferenceData?.entryPoints?.find((ep: any) => ep.uri)?.uri;
 
       return {
         id: e.id || '',
         title: e.summary || '(No title)',
-        start_iso: startIso,
-        end_iso: endIso,
-        all_day: allDay,
+        start_iso: startDateTime || `${start.date}T00:00:00`,
+        end_iso: endDateTime || `${end.date}T00:00:00`,
+        all_day: !startDateTime,
         location: e.location || undefined,
         meeting_link: meetingLink,
       };
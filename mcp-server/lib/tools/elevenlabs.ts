@@ -1,7 +1,29 @@
+import { fetchWithRetry, mapWithConcurrency } from './fetch-utils';
+
 interface Env {
   ELEVENLABS_API_KEY?: string;
   ELEVENLABS_VOICE_ID?: string;
   ELEVENLABS_MODEL_ID?: string;
+  ELEVENLABS_CONCURRENCY?: string;
+}
+
+// Symbols the voice reads awkwardly, rewritten in a single pass
+const TTS_SUBS: Record<string, string> = { '/': ' and ', ' — ': ', ', ' → ': ', ' };
+const TTS_SUBS_RE = /\/| — | → /g;
+
+// Parallel synthesis requests per script; ElevenLabs' concurrency limits
+// start at 2-5 depending on plan, so default to the lowest
+const DEFAULT_TTS_CONCURRENCY = 2;
+const TTS_MAX_RETRIES = 3;
+
+// Split on blank lines (the brief's section boundaries); MP3 frames from
+// separate requests concatenate into one playable stream.
+function splitForTts(text: string): string[] {
+  const parts = text
+    .split(/\n\s*\n/)
+    .map((part) => part.trim())
+    .filter(Boolean);
+  return parts.length > 0 ? parts : [text];
 }
 
 export async function synthesizeSpeech(
@@ -22,37 +44,53 @@ export async function synthesizeSpeech(
       throw new Error('ElevenLabs voice ID not configured');
     }
 
+    const concurrency = parseInt(env.ELEVENLABS_CONCURRENCY || '', 10) || DEFAULT_TTS_CONCURRENCY;
+
     // Preprocess text to speed up speech
-    const textFast = text.replace(/\//g, ' and ').replace(/ — /g, ', ').replace(/ → /g, ', ');
+    const textFast = text.replace(TTS_SUBS_RE, (m) => TTS_SUBS[m]);
 
-    const response = await fetch(`https://api.elevenlabs.io/v1/text-to-speech/${voiceId}`, {
-      method: 'POST',
-      headers: {
-        'xi-api-key': apiKey,
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        text: textFast,
-        model_id: modelId,
-        voice_settings: {
-          stability: 0.4,
-          similarity_boost: 0.75,
+    const synthesize = async (chunk: string, previousText?: string, nextText?: string): Promise<Uint8Array> => {
+      // Backs off when the plan's concurrency limit is hit (429)
+      const response = await fetchWithRetry(
+        `https://api.elevenlabs.io/v1/text-to-speech/${voiceId}`,
+        {
+          method: 'POST',
+          headers: {
+            'xi-api-key': apiKey,
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({
+            text: chunk,
+            model_id: modelId,
+            // Neighbouring text keeps intonation continuous across chunk seams
+            previous_text: previousText,
+            next_text: nextText,
+            voice_settings: {
+              stability: 0.4,
+              similarity_boost: 0.75,
+            },
+          }),
         },
-      }),
-      // Increase timeout for longer audio generation
-      signal: AbortSignal.timeout(30000), // 30 second timeout
-    });
+        // Longer audio takes a while to generate, so allow 30 seconds per attempt
+        { retries: TTS_MAX_RETRIES, baseDelayMs: 1000, timeoutMs: 30000 },
+      );
 
-    if (!response.ok) {
-      const errorText = await response.text();
-      throw new Error(`ElevenLabs API error: ${response.statusText} - ${errorText}`);
-    }
+      if (!response.ok) {
+        const errorText = await response.text();
+        throw new Error(`ElevenLabs API error: ${response.statusText} - ${errorText}`);
+      }
+
+      return new Uint8Array(await response.arrayBuffer());
+    };
+
+    // Synthesize sections concurrently (bounded) and stitch them back in order
+    const chunks = splitForTts(textFast);
+    const buffers = await mapWithConcurrency(chunks, concurrency, (chunk, i) =>
+      synthesize(chunk, chunks[i - 1], chunks[i + 1]),
+    );
 
-    const audioBuffer = await response.arrayBuffer();
-    // Convert ArrayBuffer to base64 in Node.js/Vercel
-    // For large files, use Buffer (more efficient than manual chunking)
-    const buffer = Buffer.from(audioBuffer);
-    const base64Audio = buffer.toString('base64');
+    // Convert to base64 in Node.js/Vercel
+    const base64Audio = Buffer.concat(buffers).toString('base64');
 
     return {
       content: [
@@ -67,4 +105,3 @@ export async function synthesizeSpeech(
     throw new Error(`Failed to synthesize speech: ${error.message}`);
   }
 }
-
@@ -0,0 +1,66 @@
+// Shared request helpers for the tool implementations
+
+export interface RetryOptions {
+  // Retries after the first attempt
+  retries: number;
+  // Backoff before retry n is baseDelayMs * 2^n unless Retry-After says otherwise
+  baseDelayMs: number;
+  // Per-attempt timeout
+  timeoutMs?: number;
+  // Wall-clock time (ms since epoch) that no attempt or backoff may run past
+  deadline?: number;
+  // Also retry network errors and timeouts, not just 429/5xx responses
+  retryErrors?: boolean;
+}
+
+// fetch with exponential backoff on rate limits (429) and 5xx. Honors
+// Retry-After. The last response is returned as is, so callers still
+// check response.ok.
+export async function fetchWithRetry(url: string, init: RequestInit, options: RetryOptions): Promise<Response> {
+  const { retries, baseDelayMs, timeoutMs, deadline, retryErrors } = options;
+  for (let attempt = 0; ; attempt++) {
+    let attemptTimeoutMs = timeoutMs;
+    if (deadline !== undefined) {
+      const remainingMs = Math.max(deadline - Date.now(), 1);
+      attemptTimeoutMs = attemptTimeoutMs === undefined ? remainingMs : Math.min(attemptTimeoutMs, remainingMs);
+    }
+    const signal = attemptTimeoutMs !== undefined ? AbortSignal.timeout(attemptTimeoutMs) : init.signal;
+
+    let response: Response | undefined;
+    let failure: unknown;
+    try {
+      response = await fetch(url, { ...init, signal });
+    } catch (error) {
+      if (!retryErrors) throw error;
+      failure = error;
+    }
+    if (response && response.status !== 429 && response.status < 500) return response;
+
+    const retryAfter = Number(response?.headers.get('Retry-After'));
+    const delayMs = retryAfter > 0 ? retryAfter * 1000 : baseDelayMs * 2 ** attempt;
+    const outOfTime = deadline !== undefined && Date.now() + delayMs >= deadline;
+    if (attempt >= retries || outOfTime) {
+      if (response) return response;
+      throw failure;
+    }
+    await new Promise((resolve) => setTimeout(resolve, delayMs));
+  }
+}
+
+// Map over items with at most `limit` calls in flight, preserving order
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i], i);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
@@ -1,3 +1,4 @@
+import { fetchWithRetry } from './fetch-utils';
 import { getGoogleAccessToken } from './google-auth';
 
 interface Email {
@@ -10,6 +11,118 @@ interface Email {
   date_iso?: string;
 }
 
+// `Display Name <address>`; bare addresses fall through to the no-match branch
+const FROM_HEADER_RE = /^([^<]*)<([^>]*)>/;
+
+const GMAIL_BATCH_URL = 'https://gmail.googleapis.com/batch/gmail/v1';
+// Gmail accepts up to 100 sub-requests per batch call, but batches larger
+// than 50 tend to get individual parts rate limited
+const GMAIL_BATCH_LIMIT = 50;
+const GMAIL_MAX_RETRIES = 3;
+
+// Fetch metadata for many messages with one multipart batch request per 50 ids
+// instead of one round trip per message. The batch call itself is retried on
+// 429/5xx, and parts that fail with 429/5xx are re-batched with backoff; other
+// failed sub-requests (e.g. a message deleted since listing) are left out.
+async function batchGetMessageMetadata(messageIds: string[], accessToken: string): Promise<Map<string, any>> {
+  const messages = new Map<string, any>();
+
+  let pending = messageIds;
+  for (let attempt = 0; pending.length > 0 && attempt <= GMAIL_MAX_RETRIES; attempt++) {
+    if (attempt > 0) {
+      await new Promise((resolve) => setTimeout(resolve, 500 * 2 ** (attempt - 1)));
+    }
+    const retryIds: string[] = [];
+
+    for (let i = 0; i < pending.length; i += GMAIL_BATCH_LIMIT) {
+      const ids = pending.slice(i, i + GMAIL_BATCH_LIMIT);
+      const boundary = `batch_morning_brief_${attempt}_${i}`;
+      const body =
+        ids
+          .map((mid) =>
+            [
+              `--${boundary}`,
+              'Content-Type: application/http',
+              `Content-ID: <${mid}>`,
+              '',
+              `GET /gmail/v1/users/me/messages/${mid}?format=metadata&metadataHeaders=From&metadataHeaders=Subject&metadataHeaders=Date`,
+              '',
+              '',
+            ].join('\r\n'),
+          )
+          .join('') + `--${boundary}--`;
+
+      const batchResponse = await fetchWithRetry(
+        GMAIL_BATCH_URL,
+        {
+          method: 'POST',
+          headers: {
+            Authorization: `Bearer ${accessToken}`,
+            'Content-Type': `multipart/mixed; boundary=${boundary}`,
+          },
+          body,
+        },
+        { retries: GMAIL_MAX_RETRIES, baseDelayMs: 500 },
+      );
+
+      if (!batchResponse.ok) {
+        throw new Error(`Gmail batch API error: ${batchResponse.statusText}`);
+      }
+
+      const boundaryMatch = /boundary=("?)([^";]+)\1/.exec(batchResponse.headers.get('content-type') || '');
+      if (!boundaryMatch) {
+        throw new Error('Gmail batch API error: missing multipart boundary');
+      }
+
+      const batchText = await batchResponse.text();
+      for (const part of batchText.split(`--${boundaryMatch[2]}`)) {
+        const idMatch = /Content-ID:\s*<response-([^>]+)>/i.exec(part);
+        const statusMatch = /HTTP\/[\d.]+ (\d{3})/.exec(part);
+        if (!idMatch || !statusMatch) continue;
+
+        const status = Number(statusMatch[1]);
+        if (status === 429 || status >= 500) {
+          retryIds.push(idMatch[1]);
+          continue;
+        }
+        if (status !== 200) continue;
+
+        const jsonStart = part.indexOf('{');
+        const jsonEnd = part.lastIndexOf('}');
+        if (jsonStart === -1 || jsonEnd < jsonStart) continue;
+
+        try {
+          messages.set(idMatch[1], JSON.parse(part.slice(jsonStart, jsonEnd + 1)));
+        } catch (e) {
+          // Skip unparseable parts
+          continue;
+        }
+      }
+    }
+
+    pending = retryIds;
+  }
+
+  return messages;
+}
+
+// Newest `n` entries by internalDate, newest first, via insertion into a
+// bounded sorted buffer: O(N·n) with n small instead of sorting all N.
+function newestN<T extends { internalDate: number }>(entries: T[], n: number): T[] {
+  const top: T[] = [];
+  if (n <= 0) return top;
+  for (const entry of entries) {
+    if (top.length === n && entry.internalDate <= top[n - 1].internalDate) continue;
+    let i = Math.min(top.length, n - 1);
+    while (i > 0 && top[i - 1].internalDate < entry.internalDate) {
+      top[i] = top[i - 1];
+      i--;
+    }
+    top[i] = entry;
+  }
+  return top;
+}
+
 interface Env {
   GOOGLE_TOKEN_BASE64?: string;
   GOOGLE_OAUTH_CLIENT_ID?: string;
@@ -28,6 +141,8 @@ export async function getGmailMessages(
     const importantSenders =
       args.important_senders ||
       (env.IMPORTANT_SENDERS ? env.IMPORTANT_SENDERS.split(',').map((s: string) => s.trim()) : []);
+    // Lowercased once up front; each thread then needs a single lookup
+    const senders = new Set(importantSenders.map((s: string) => s.toLowerCase()));
     const maxResults = args.max_results || parseInt(env.GMAIL_MAX || '5', 10);
 
     const accessToken = await getGoogleAccessToken(env);
@@ -50,36 +165,41 @@ export async function getGmailMessages(
     const listData = await listResponse.json();
     const messageIds = (listData.messages || []).map((m: any) => m.id);
 
-    // Fetch message metadata
-    const emails: Email[] = [];
-    const messageMetadata: Map<string, any> = new Map();
+    // Fetch message metadata, keeping only the newest message per thread
+    const threadBest = new Map<string, { internalDate: number; email: Email }>();
+
+    const batched = await batchGetMessageMetadata(messageIds, accessToken);
 
     for (const mid of messageIds) {
       try {
-        const msgUrl = `https://gmail.googleapis.com/gmail/v1/users/me/messages/${mid}?format=metadata&metadataHeaders=From&metadataHeaders=Subject&metadataHeaders=Date`;
-        const msgResponse = await fetch(msgUrl, {
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
-        });
+        const msg = batched.get(mid);
+        if (!msg) continue;
 
-        if (!msgResponse.ok) continue;
-
-        const msg = await msgResponse.json();
-        const headers = (msg.payload?.headers || []).reduce((acc: any, h: any) => {
-          acc[h.name.toLowerCase()] = h.value;
-          return acc;
-        }, {});
+        // Single pass over the (at most three) requested headers
+        let fromHeader = '';
+        let subject: string | undefined;
+        let dateIso: string | undefined;
+        for (const h of msg.payload?.headers || []) {
+          switch (h.name.toLowerCase()) {
+            case 'from':
+              fromHeader = h.value || '';
+              break;
+            case 'subject':
+              subject = h.value;
+              break;
+            case 'date':
+              dateIso = h.value;
+              break;
+          }
+        }
 
-        const fromHeader = headers.from || '';
         let fromName: string | undefined;
         let fromEmail: string | undefined;
 
-        if (fromHeader.includes('<') && fromHeader.includes('>')) {
-          const namePart = fromHeader.split('<')[0].trim().replace(/^"|"$/g, '');
-          const emailPart = fromHeader.split('<')[1].split('>')[0].trim();
-          fromName = namePart || undefined;
-          fromEmail = emailPart || undefined;
+        const fromMatch = FROM_HEADER_RE.exec(fromHeader);
+        if (fromMatch) {
+          fromName = fromMatch[1].trim().replace(/^"|"$/g, '') || undefined;
+          fromEmail = fromMatch[2].trim() || undefined;
         } else {
           fromEmail = fromHeader || undefined;
         }
@@ -89,45 +209,29 @@ export async function getGmailMessages(
           thread_id: msg.threadId,
           from_name: fromName,
           from_email: fromEmail,
-          subject: headers.subject || '(No subject)',
+          subject: subject || '(No subject)',
           snippet: (msg.snippet || '').trim(),
-          date_iso: headers.date,
+          date_iso: dateIso,
         };
 
-        emails.push(email);
-        messageMetadata.set(mid, {
-          email,
-          internal_date: parseInt(msg.internalDate || '0', 10),
-          labels: msg.labelIds || [],
-        });
+        const threadId = email.thread_id || mid;
+        const internalDate = parseInt(msg.internalDate || '0', 10);
+        const current = threadBest.get(threadId);
+        if (!current || internalDate > current.internalDate) {
+          threadBest.set(threadId, { internalDate, email });
+        }
       } catch (e) {
         // Skip failed messages
         continue;
       }
     }
 
-    // Deduplicate by thread_id
-    const threadToEmail = new Map<string, Email>();
-    const threadToMetadata = new Map<string, any>();
-
-    for (const [mid, metadata] of messageMetadata.entries()) {
-      const email = metadata.email;
-      const threadId = email.thread_id || mid;
-      const internalDate = metadata.internal_date;
-
-      if (!threadToMetadata.has(threadId) || internalDate > threadToMetadata.get(threadId).internal_date) {
-        threadToEmail.set(threadId, email);
-        threadToMetadata.set(threadId, metadata);
-      }
-    }
-
-    const uniqueThreads = Array.from(threadToEmail.values());
+    const uniqueThreads = Array.from(threadBest.values());
 
     // Apply importance filter if configured
-    let important: Email[] = [];
-    if (importantSenders.length > 0) {
-      const senders = new Set(importantSenders.map((s: string) => s.toLowerCase()));
-      important = uniqueThreads.filter((e) => e.from_email && senders.has(e.from_email.toLowerCase()));
+    let important: Array<{ internalDate: number; email: Email }> = [];
+    if (senders.size > 0) {
+      important = uniqueThreads.filter(({ email: e }) => e.from_email && senders.has(e.from_email.toLowerCase()));
     }
 
     // If no important senders matched or none configured, use all threads
@@ -135,14 +239,8 @@ export async function getGmailMessages(
       important = uniqueThreads;
     }
 
-    // Sort by internal date (most recent first) and limit
-    const sorted = important
-      .sort((a, b) => {
-        const aDate = messageMetadata.get(a.id)?.internal_date || 0;
-        const bDate = messageMetadata.get(b.id)?.internal_date || 0;
-        return bDate - aDate;
-      })
-      .slice(0, maxResults);
+    // Keep the most recent maxResults threads without sorting them all
+    const sorted = newestN(important, maxResults).map(({ email }) => email);
 
     return {
       content: [
@@ -4,7 +4,27 @@ interface Env {
   GOOGLE_OAUTH_CLIENT_SECRET?: string;
 }
 
+// Access token shared across tool calls on a warm instance. Calendar and Gmail
+// are requested concurrently, so the in-flight refresh is shared as well.
+let cachedToken: { token: string; expiresAt: number } | null = null;
+let inflightToken: Promise<string> | null = null;
+
+// Refresh a minute early so a token never expires mid-request
+const EXPIRY_MARGIN_MS = 60 * 1000;
+
 export async function getGoogleAccessToken(env: Env): Promise<string> {
+  if (cachedToken && Date.now() < cachedToken.expiresAt - EXPIRY_MARGIN_MS) {
+    return cachedToken.token;
+  }
+  if (!inflightToken) {
+    inflightToken = resolveGoogleAccessToken(env).finally(() => {
+      inflightToken = null;
+    });
+  }
+  return inflightToken;
+}
+
+async function resolveGoogleAccessToken(env: Env): Promise<string> {
   // Handle Google OAuth token
   // Option 1: Use base64 encoded token.json
   if (env.GOOGLE_TOKEN_BASE64) {
@@ -65,6 +85,10 @@ export async function getGoogleAccessToken(env: Env): Promise<string> {
         throw new Error('No access_token in refresh response');
       }
       
+      cachedToken = {
+        token: refreshed.access_token,
+        expiresAt: Date.now() + (refreshed.expires_in || 3600) * 1000,
+      };
       return refreshed.access_token;
     }
     
@@ -1,3 +1,5 @@
+import { fetchWithRetry, mapWithConcurrency } from './fetch-utils';
+
 interface Task {
   id: string;
   name: string;
@@ -7,6 +9,89 @@ interface Task {
   url?: string;
 }
 
+// Notion allows ~3 requests/second per integration
+const NOTION_CONCURRENCY = 3;
+
+// Area pages rarely change, so their titles are kept for warm invocations
+const AREA_TITLE_TTL_MS = 30 * 60 * 1000;
+const areaTitleCache = new Map<string, { expiresAt: number; title?: string }>();
+
+const NOTION_MAX_RETRIES = 3;
+
+// Safety cap on paging through the today/upcoming query (100 rows per page)
+const NOTION_MAX_QUERY_PAGES = 5;
+
+// fetch against the Notion API, backing off on rate limits (429) and 5xx;
+// all calls here are reads, so retrying is safe
+function notionFetch(url: string, init: RequestInit): Promise<Response> {
+  return fetchWithRetry(url, init, { retries: NOTION_MAX_RETRIES, baseDelayMs: 300 });
+}
+
+// Database schemas are effectively static, so the derived fields are kept for a day
+const DB_SCHEMA_TTL_MS = 24 * 60 * 60 * 1000;
+interface DbSchema {
+  dueProp: string;
+  titleProp?: string;
+  statusProp?: string;
+  statusType?: 'status' | 'select';
+  areaProp?: string;
+}
+
+const dbSchemaCache = new Map<string, DbSchema & { expiresAt: number }>();
+
+// Find the due date and status/done properties of a task database
+async function getDbSchema(
+  databaseId: string,
+  notionHeaders: Record<string, string>,
+): Promise<DbSchema> {
+  const cached = dbSchemaCache.get(databaseId);
+  if (cached && cached.expiresAt > Date.now()) return cached;
+
+  const dbResponse = await notionFetch(`https://api.notion.com/v1/databases/${databaseId}`, {
+    headers: notionHeaders,
+  });
+
+  if (!dbResponse.ok) {
+    throw new Error(`Notion API error: ${dbResponse.statusText}`);
+  }
+
+  const db = await dbResponse.json();
+  const properties = db.properties || {};
+
+  // Find due date property
+  let dueProp = 'Due';
+  for (const cand of ['Due', 'Due date', 'Due Date', 'Date']) {
+    if (properties[cand]?.type === 'date') {
+      dueProp = cand;
+      break;
+    }
+  }
+
+  // Find the title, status/done and Area relation properties in one pass so
+  // pages can be read by key instead of scanning their properties each time
+  let titleProp: string | undefined;
+  let statusProp: string | undefined;
+  let statusType: 'status' | 'select' | undefined;
+  let areaProp: string | undefined;
+  for (const [name, prop] of Object.entries(properties)) {
+    const propType = (prop as any).type;
+    if (propType === 'title') {
+      titleProp ??= name;
+    } else if ((propType === 'status' || propType === 'select') && name.toLowerCase() === 'done') {
+      if (!statusProp) {
+        statusProp = name;
+        statusType = propType;
+      }
+    } else if (propType === 'relation' && name.toLowerCase() === 'area') {
+      areaProp ??= name;
+    }
+  }
+
+  const schema = { expiresAt: Date.now() + DB_SCHEMA_TTL_MS, dueProp, titleProp, statusProp, statusType, areaProp };
+  dbSchemaCache.set(databaseId, schema);
+  return schema;
+}
+
 interface Env {
   NOTION_API_KEY?: string;
   NOTION_TASK_DATABASE_ID?: string;
@@ -44,30 +129,8 @@ export async function getNotionTasks(
       'Content-Type': 'application/json',
     };
 
-    // Get database properties to find due date and status fields
-    const dbUrl = `https://api.notion.com/v1/databases/${databaseId}`;
-    const dbResponse = await fetch(dbUrl, {
-      headers: notionHeaders,
-    });
-
-    if (!dbResponse.ok) {
-      throw new Error(`Notion API error: ${dbResponse.statusText}`);
-    }
-
-    const db = await dbResponse.json();
-    const properties = db.properties || {};
-
-    // Find due date property
-    let dueProp = 'Due';
-    for (const cand of ['Due', 'Due date', 'Due Date', 'Date']) {
-      if (properties[cand]?.type === 'date') {
-        dueProp = cand;
-        break;
-      }
-    }
+    const { dueProp, titleProp, statusProp, statusType, areaProp } = await getDbSchema(databaseId, notionHeaders);
 
-    // Find status/done property
-    let statusProp: string | undefined;
     const doneValues = new Set(
       (env.NOTION_DONE_VALUES || 'Done')
         .split(',')
@@ -75,146 +138,87 @@ export async function getNotionTasks(
         .filter(Boolean),
     );
 
-    for (const [name, prop] of Object.entries(properties)) {
-      const propType = (prop as any).type;
-      if ((propType === 'status' || propType === 'select') && name.toLowerCase() === 'done') {
-        statusProp = name;
-        break;
-      }
-    }
+    // Not done: one does_not_equal clause per done value, all of which must hold.
+    // The condition key follows the property type (status or select).
+    const notDoneClauses =
+      statusProp && statusType && doneValues.size > 0
+        ? Array.from(doneValues).map((dv) => ({ property: statusProp, [statusType]: { does_not_equal: dv } }))
+        : [];
+    const doneFilteredByServer = notDoneClauses.length > 0;
 
-    // Build filters
-    const buildFilter = (dateFilter: any) => {
-      const parts = [dateFilter];
-      if (statusProp && doneValues.size > 0) {
-        if (doneValues.size === 1) {
-          parts.push({
-            property: statusProp,
-            status: { does_not_equal: Array.from(doneValues)[0] },
-          });
-        } else {
-          parts.push({
-            or: Array.from(doneValues).map((dv) => ({
-              property: statusProp,
-              status: { does_not_equal: dv },
-            })),
-          });
+    // Today and upcoming are one contiguous range, queried together from the
+    // start of today so today's tasks come first and are never crowded out.
+    // Overdue runs alongside as its own single page, as before.
+    const futureEnd = new Date(Date.now() + daysAhead * 24 * 60 * 60 * 1000).toISOString();
+    const queryUrl = `https://api.notion.com/v1/databases/${databaseId}/query`;
+    const queryPages = async (dateClauses: object[], maxPages: number): Promise<any[]> => {
+      const results: any[] = [];
+      let cursor: string | undefined;
+      for (let pageCount = 0; pageCount < maxPages; pageCount++) {
+        const res = await notionFetch(queryUrl, {
+          method: 'POST',
+          headers: notionHeaders,
+          body: JSON.stringify({
+            filter: { and: [...dateClauses, ...notDoneClauses] },
+            sorts: [{ property: dueProp, direction: 'ascending' }],
+            page_size: 100,
+            start_cursor: cursor,
+          }),
+        });
+        if (!res.ok) {
+          throw new Error(`Notion API error: ${res.statusText}`);
         }
+        const data = await res.json();
+        results.push(...(data.results || []));
+        if (!data.has_more) return results;
+        cursor = data.next_cursor;
       }
-      return { and: parts };
+      console.warn(`Notion task query stopped after ${maxPages * 100} rows; later tasks were not fetched`);
+      return results;
     };
 
-    // Query tasks
-    const queryUrl = `https://api.notion.com/v1/databases/${databaseId}/query`;
-
-    // Overdue tasks
-    const overdueFilter = buildFilter({
-      property: dueProp,
-      date: { before: todayStart },
-    });
-
-    // Today's tasks
-    const todayFilter = buildFilter({
-      and: [
-        { property: dueProp, date: { on_or_after: todayStart } },
-        { property: dueProp, date: { on_or_before: todayEnd } },
-      ],
-    });
-
-    // Upcoming tasks
-    const futureEnd = new Date(Date.now() + daysAhead * 24 * 60 * 60 * 1000).toISOString();
-    const upcomingFilter = buildFilter({
-      and: [
-        { property: dueProp, date: { after: todayEnd } },
-        { property: dueProp, date: { before: futureEnd } },
-      ],
-    });
-
-    const [overdueRes, todayRes, upcomingRes] = await Promise.all([
-      fetch(queryUrl, {
-        method: 'POST',
-        headers: notionHeaders,
-        body: JSON.stringify({
-          filter: overdueFilter,
-          sorts: [{ property: dueProp, direction: 'ascending' }],
-          page_size: 100,
-        }),
-      }),
-      fetch(queryUrl, {
-        method: 'POST',
-        headers: notionHeaders,
-        body: JSON.stringify({
-          filter: todayFilter,
-          sorts: [{ property: dueProp, direction: 'ascending' }],
-          page_size: 100,
-        }),
-      }),
-      fetch(queryUrl, {
-        method: 'POST',
-        headers: notionHeaders,
-        body: JSON.stringify({
-          filter: upcomingFilter,
-          sorts: [{ property: dueProp, direction: 'ascending' }],
-          page_size: 100,
-        }),
-      }),
+    const [overduePages, currentPages] = await Promise.all([
+      queryPages([{ property: dueProp, date: { before: todayStart } }], 1),
+      queryPages(
+        [
+          { property: dueProp, date: { on_or_after: todayStart } },
+          { property: dueProp, date: { before: futureEnd } },
+        ],
+        NOTION_MAX_QUERY_PAGES,
+      ),
     ]);
+    const pages = overduePages.concat(currentPages);
 
-    const [overdueData, todayData, upcomingData] = await Promise.all([
-      overdueRes.json(),
-      todayRes.json(),
-      upcomingRes.json(),
-    ]);
+    // Date-only dues compare by calendar day against the local dates of the
+    // window; timed dues compare as instants. The window end is the exclusive
+    // next midnight, so both checks are half-open.
+    const todayStartMs = Date.parse(todayStart);
+    const todayEndMs = Date.parse(todayEnd);
+    const todayStartDate = todayStart.slice(0, 10);
+    const todayEndDate = todayEnd.slice(0, 10);
+    const bucketOf = (due: string | undefined): 'overdue' | 'today' | 'upcoming' | undefined => {
+      if (!due) return undefined;
+      if (due.length === 10) {
+        if (due < todayStartDate) return 'overdue';
+        return due < todayEndDate ? 'today' : 'upcoming';
+      }
+      const dueMs = Date.parse(due);
+      if (dueMs < todayStartMs) return 'overdue';
+      return dueMs < todayEndMs ? 'today' : 'upcoming';
+    };
 
-    // Convert pages to tasks
-    const pageToTask = async (page: any): Promise<Task> => {
+    // Convert pages to tasks; Area relations are collected here and resolved
+    // in one deduplicated batch below instead of one fetch per task
+    const pageToTask = (page: any): { task: Task; areaId?: string } => {
       const props = page.properties || {};
 
-      // Find title property
-      let titleProp: string | undefined;
-      for (const [name, prop] of Object.entries(props)) {
-        if ((prop as any).type === 'title') {
-          titleProp = name;
-          break;
-        }
-      }
-
-      const nameVal = titleProp
-        ? (props[titleProp] as any).title?.map((t: any) => t.plain_text).join('') || page.id
-        : page.id;
+      const nameVal = (titleProp && props[titleProp]?.title?.map((t: any) => t.plain_text).join('')) || page.id;
 
       // Get due date
       const dueDate = props[dueProp]?.date?.start;
 
       // Get area (relation property)
-      let area: string | undefined;
-      for (const [name, prop] of Object.entries(props)) {
-        if ((prop as any).type === 'relation' && name.toLowerCase() === 'area') {
-          const relations = (prop as any).relation || [];
-          if (relations.length > 0) {
-            // Fetch related page to get title
-            try {
-              const relatedUrl = `https://api.notion.com/v1/pages/${relations[0].id}`;
-              const relatedRes = await fetch(relatedUrl, {
-                headers: notionHeaders,
-              });
-              if (relatedRes.ok) {
-                const relatedPage = await relatedRes.json();
-                const relatedProps = relatedPage.properties || {};
-                for (const [rName, rProp] of Object.entries(relatedProps)) {
-                  if ((rProp as any).type === 'title') {
-                    area = (rProp as any).title?.map((t: any) => t.plain_text).join('');
-                    break;
-                  }
-                }
-              }
-            } catch (e) {
-              // Skip area if fetch fails
-            }
-          }
-          break;
-        }
-      }
+      const areaId: string | undefined = areaProp ? props[areaProp]?.relation?.[0]?.id : undefined;
 
       // Get done status
       let done = false;
@@ -230,28 +234,75 @@ export async function getNotionTasks(
       }
 
       return {
-        id: page.id,
-        name: nameVal || '(Untitled)',
-        due_iso: dueDate,
-        area,
-        done,
-        url: page.url,
+        task: {
+          id: page.id,
+          name: nameVal || '(Untitled)',
+          due_iso: dueDate,
+          area: undefined,
+          done,
+          url: page.url,
+        },
+        areaId,
       };
     };
 
-    const [overdueTasks, todayTasks, upcomingTasks] = await Promise.all([
-      Promise.all((overdueData.results || []).map(pageToTask)),
-      Promise.all((todayData.results || []).map(pageToTask)),
-      Promise.all((upcomingData.results || []).map(pageToTask)),
-    ]);
+    // Fetch a related Area page and return its title
+    const fetchAreaTitle = async (pageId: string): Promise<string | undefined> => {
+      try {
+        const relatedRes = await notionFetch(`https://api.notion.com/v1/pages/${pageId}`, {
+          headers: notionHeaders,
+        });
+        if (!relatedRes.ok) return undefined;
+        const relatedPage = await relatedRes.json();
+        for (const rProp of Object.values(relatedPage.properties || {})) {
+          if ((rProp as any).type === 'title') {
+            return (rProp as any).title?.map((t: any) => t.plain_text).join('');
+          }
+        }
+      } catch (e) {
+        // Skip area if fetch fails
+      }
+      return undefined;
+    };
 
-    // Filter out done tasks
-    const filterDone = (tasks: Task[]) => tasks.filter((t) => !t.done);
+    const allEntries = pages.map(pageToTask);
+
+    // Done tasks are dropped below, so their areas are never needed
+    const areaIds = Array.from(
+      new Set(allEntries.flatMap((e) => (e.areaId && !e.task.done ? [e.areaId] : []))),
+    );
+    const now = Date.now();
+    const missingAreaIds = areaIds.filter((id) => {
+      const cached = areaTitleCache.get(id);
+      return !cached || cached.expiresAt <= now;
+    });
+    const fetchedTitles = await mapWithConcurrency(missingAreaIds, NOTION_CONCURRENCY, fetchAreaTitle);
+    missingAreaIds.forEach((id, i) => {
+      // Failed lookups are retried on the next run rather than cached
+      if (fetchedTitles[i] !== undefined) {
+        areaTitleCache.set(id, { expiresAt: now + AREA_TITLE_TTL_MS, title: fetchedTitles[i] });
+      }
+    });
+    for (const { task, areaId } of allEntries) {
+      if (areaId) task.area = areaTitleCache.get(areaId)?.title;
+    }
+
+    const overdueTasks: Task[] = [];
+    const todayTasks: Task[] = [];
+    const upcomingTasks: Task[] = [];
+    for (const { task } of allEntries) {
+      // Done tasks are dropped here unless the query already excluded them
+      if (!doneFilteredByServer && task.done) continue;
+      const bucket = bucketOf(task.due_iso);
+      if (bucket === 'overdue') overdueTasks.push(task);
+      else if (bucket === 'today') todayTasks.push(task);
+      else if (bucket === 'upcoming') upcomingTasks.push(task);
+    }
 
     const result = {
-      today: filterDone(todayTasks),
-      overdue: filterDone(overdueTasks),
-      upcoming: filterDone(upcomingTasks),
+      today: todayTasks,
+      overdue: overdueTasks,
+      upcoming: upcomingTasks,
     };
 
     return {
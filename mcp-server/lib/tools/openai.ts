@@ -1,3 +1,88 @@
+import { fetchWithRetry } from './fetch-utils';
+
+// Static system prompt, trimmed and split around its {nickname} and {tz}
+// slots once at load; each call only concatenates the three pieces.
+const SYSTEM_PROMPT_PARTS = `
+You are a world-class personal assistant creating a 45–70 second VOICE NOTE.
+Speak to the user as "{nickname}".
+
+STYLE:
+- Warm, crisp, competent; a hint of playful wit.
+- Natural speech only: no headings, no bullets, no emoji, no dictation artifacts.
+- 24-hour times for {tz} (e.g., 09:05, 16:30). Say the day and date up front.
+- Don't read raw URLs; say "Zoom link", "calendar link", or "location link".
+- End with ONE original, funny but tasteful one-liner (not a famous quote, 6–14 words).
+
+INTELLIGENCE:
+- CRITICAL: Group ALL Notion tasks by their Area property. Say "For [Area name], you have: [list tasks]". If area is null/empty, group those as "Other tasks: [list]".
+- Do NOT mention dates for tasks due today - they're due TODAY, no need to say the date.
+- Skip any tasks with done=true.
+- Notice back-to-back events; suggest a travel/water/coffee buffer if sensible.
+- Collapse noise: keep top 2–3 from Emails unless empty.
+- If a section is empty, acknowledge briefly and move on.
+- Prefer specifics that matter (time, title, who, where) over generic filler.
+- DO NOT mention upcoming events or tasks - only focus on TODAY.
+
+LENGTH:
+- Target 45–70 seconds. Keep sentences short and flowing.
+`
+  .trim()
+  .split(/\{(?:nickname|tz)\}/);
+
+const OPENAI_CHAT_URL = 'https://api.openai.com/v1/chat/completions';
+const OPENAI_TIMEOUT_MS = 30000;
+const OPENAI_MAX_RETRIES = 2;
+// All attempts, backoff and the streamed read must finish inside the Python
+// client's 60s MCP request timeout, leaving headroom for the rest of the call
+const OPENAI_TOTAL_BUDGET_MS = 45000;
+
+// fetch shares one keep-alive connection pool per instance, so repeated calls
+// reuse the TLS session; this adds the timeout/retry policy an SDK client would.
+function postChatCompletion(apiKey: string, body: string): Promise<Response> {
+  return fetchWithRetry(
+    OPENAI_CHAT_URL,
+    {
+      method: 'POST',
+      headers: {
+        Authorization: `Bearer ${apiKey}`,
+        'Content-Type': 'application/json',
+      },
+      body,
+    },
+    {
+      retries: OPENAI_MAX_RETRIES,
+      baseDelayMs: 500,
+      timeoutMs: OPENAI_TIMEOUT_MS,
+      deadline: Date.now() + OPENAI_TOTAL_BUDGET_MS,
+      retryErrors: true,
+    },
+  );
+}
+
+// Collect the assistant text from a streamed (SSE) chat completion
+async function readChatStream(response: Response): Promise<string> {
+  if (!response.body) return '';
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  const parts: string[] = [];
+  let buffered = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffered += value;
+    let newline: number;
+    while ((newline = buffered.indexOf('\n')) !== -1) {
+      const line = buffered.slice(0, newline).trim();
+      buffered = buffered.slice(newline + 1);
+      if (!line.startsWith('data:')) continue;
+      const payload = line.slice(5).trim();
+      if (payload === '[DONE]') return parts.join('');
+      const delta = JSON.parse(payload).choices?.[0]?.delta?.content;
+      if (delta) parts.push(delta);
+    }
+  }
+  return parts.join('');
+}
+
 interface Env {
   OPENAI_API_KEY?: string;
   OPENAI_MODEL?: string;
@@ -29,30 +114,7 @@ export async function generateVoiceScript(
     const tasksToday = (args.tasks_today || []).filter((t: any) => !t.done);
     const emails = args.emails || [];
 
-    const systemPrompt = `
-You are a world-class personal assistant creating a 45–70 second VOICE NOTE.
-Speak to the user as "${nickname}".
-
-STYLE:
-- Warm, crisp, competent; a hint of playful wit.
-- Natural speech only: no headings, no bullets, no emoji, no dictation artifacts.
-- 24-hour times for ${tz} (e.g., 09:05, 16:30). Say the day and date up front.
-- Don't read raw URLs; say "Zoom link", "calendar link", or "location link".
-- End with ONE original, funny but tasteful one-liner (not a famous quote, 6–14 words).
-
-INTELLIGENCE:
-- CRITICAL: Group ALL Notion tasks by their Area property. Say "For [Area name], you have: [list tasks]". If area is null/empty, group those as "Other tasks: [list]".
-- Do NOT mention dates for tasks due today - they're due TODAY, no need to say the date.
-- Skip any tasks with done=true.
-- Notice back-to-back events; suggest a travel/water/coffee buffer if sensible.
-- Collapse noise: keep top 2–3 from Emails unless empty.
-- If a section is empty, acknowledge briefly and move on.
-- Prefer specifics that matter (time, title, who, where) over generic filler.
-- DO NOT mention upcoming events or tasks - only focus on TODAY.
-
-LENGTH:
-- Target 45–70 seconds. Keep sentences short and flowing.
-`;
+    const systemPrompt = `${SYSTEM_PROMPT_PARTS[0]}${nickname}${SYSTEM_PROMPT_PARTS[1]}${tz}${SYSTEM_PROMPT_PARTS[2]}`;
 
     const userPayload = {
       user_nickname: nickname,
@@ -69,35 +131,38 @@ LENGTH:
       },
     };
 
-    const response = await fetch('https://api.openai.com/v1/chat/completions', {
-      method: 'POST',
-      headers: {
-        Authorization: `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
+    const response = await postChatCompletion(
+      apiKey,
+      JSON.stringify({
         model,
         temperature: 0.35,
+        stream: true,
+        stream_options: { include_usage: true },
         messages: [
-          { role: 'system', content: systemPrompt.trim() },
+          { role: 'system', content: systemPrompt },
           { role: 'user', content: JSON.stringify(userPayload) },
         ],
       }),
-    });
+    );
 
     if (!response.ok) {
       throw new Error(`OpenAI API error: ${response.statusText}`);
     }
 
-    const data = await response.json();
-    const voiceText = data.choices?.[0]?.message?.content?.trim() || '';
+    // Streamed so tokens are consumed as they are generated instead of after the full completion
+    const voiceText = (await readChatStream(response)).trim();
 
     // Soft guardrail for length
     const maxChars = 1200;
     if (voiceText.length > maxChars) {
-      const parts = voiceText.split('. ');
-      const head = parts.slice(0, 6).join('. ');
-      const tail = parts[parts.length - 1];
+      // First six sentences plus the last one, located by index rather than split/join
+      let headEnd = -2;
+      for (let i = 0; i < 6 && headEnd !== -1; i++) {
+        headEnd = voiceText.indexOf('. ', headEnd + 2);
+      }
+      const head = headEnd === -1 ? voiceText : voiceText.slice(0, headEnd);
+      const lastBreak = voiceText.lastIndexOf('. ');
+      const tail = lastBreak === -1 ? voiceText : voiceText.slice(lastBreak + 2);
       const trimmed = `${head}. … ${tail}`.trim();
       return {
         content: [
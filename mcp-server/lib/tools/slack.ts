@@ -4,6 +4,36 @@ interface Env {
   SLACK_FALLBACK_CHANNEL?: string;
 }
 
+// DM channel ids are stable per user for the bot's lifetime, so each user's is
+// opened once per instance and reused by later posts and uploads
+const dmChannels = new Map<string, string>();
+
+async function openDmChannel(token: string, userId: string): Promise<string> {
+  const cached = dmChannels.get(userId);
+  if (cached) return cached;
+
+  const dmResponse = await fetch('https://slack.com/api/conversations.open', {
+    method: 'POST',
+    headers: {
+      Authorization: `Bearer ${token}`,
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ users: userId }),
+  });
+
+  if (!dmResponse.ok) {
+    throw new Error('Failed to open Slack DM');
+  }
+
+  const dmData = await dmResponse.json();
+  if (!dmData.ok || !dmData.channel?.id) {
+    throw new Error(`Failed to get Slack channel ID: ${dmData.error || 'Unknown error'}`);
+  }
+
+  dmChannels.set(userId, dmData.channel.id);
+  return dmData.channel.id;
+}
+
 export async function postToSlack(
   args: { user_id?: string; channel?: string; text: string },
   env: Env,
@@ -23,21 +53,7 @@ export async function postToSlack(
     // Try DM first if user_id provided
     if (userId) {
       try {
-        const dmResponse = await fetch('https://slack.com/api/conversations.open', {
-          method: 'POST',
-          headers: {
-            Authorization: `Bearer ${token}`,
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({ users: userId }),
-        });
-
-        if (dmResponse.ok) {
-          const dmData = await dmResponse.json();
-          if (dmData.ok && dmData.channel?.id) {
-            channelId = dmData.channel.id;
-          }
-        }
+        channelId = await openDmChannel(token, userId);
       } catch (e) {
         // Fall through to channel
       }
@@ -105,25 +121,7 @@ export async function uploadFileToSlack(
     }
 
     // Open DM channel
-    const dmResponse = await fetch('https://slack.com/api/conversations.open', {
-      method: 'POST',
-      headers: {
-        Authorization: `Bearer ${token}`,
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({ users: userId }),
-    });
-
-    if (!dmResponse.ok) {
-      throw new Error('Failed to open Slack DM');
-    }
-
-    const dmData = await dmResponse.json();
-    if (!dmData.ok || !dmData.channel?.id) {
-      throw new Error(`Failed to get Slack channel ID: ${dmData.error || 'Unknown error'}`);
-    }
-
-    const channelId = dmData.channel.id;
+    const channelId = await openDmChannel(token, userId);
 
     // Decode base64 file data
     const fileBuffer = Buffer.from(args.file_data, 'base64');
@@ -1,18 +1,72 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Tuple
 
 from dotenv import load_dotenv
 
 
-load_dotenv()
+_DOTENV_LOADED = False
 
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+# One comma-separated item with surrounding whitespace excluded; empty items never match
+_CSV_ITEM_RE = re.compile(r"[^,\s]+(?:[^,]*[^,\s])?")
 
-@dataclass(frozen=True)
+
+def _ensure_dotenv() -> None:
+    """Load .env once per process; later calls skip re-scanning the file."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def _parse_csv_lower(raw: str) -> List[str]:
+    return _CSV_ITEM_RE.findall(raw.lower())
+
+
+def _parse_int(default: int) -> Callable[[str], int]:
+    def parse(raw: str) -> int:
+        digits = raw[1:] if raw[:1] in "+-" else raw
+        return int(raw) if digits.isdecimal() else default
+
+    return parse
+
+
+def _parse_bool(raw: str) -> bool:
+    return raw.lower() in _TRUTHY
+
+
+# (field, env var, default, coerce) — coerce runs on the stripped value or the default
+_ENV_TABLE: Tuple[Tuple[str, str, Optional[str], Optional[Callable[[str], Any]]], ...] = (
+    ("mcp_server_url", "MCP_SERVER_URL", None, None),
+    ("slack_bot_token", "SLACK_BOT_TOKEN", None, None),
+    ("slack_user_id", "SLACK_USER_ID", None, None),
+    ("slack_fallback_channel", "SLACK_FALLBACK_CHANNEL", None, None),
+    ("notion_api_key", "NOTION_API_KEY", None, None),
+    ("notion_task_database_id", "NOTION_TASK_DATABASE_ID", None, None),
+    ("google_calendar_id", "GOOGLE_CALENDAR_ID", "primary", None),
+    ("google_oauth_client_id", "GOOGLE_OAUTH_CLIENT_ID", None, None),
+    ("google_oauth_client_secret", "GOOGLE_OAUTH_CLIENT_SECRET", None, None),
+    ("gmail_query", "GMAIL_QUERY", "label:INBOX newer_than:1d", None),
+    ("important_senders", "IMPORTANT_SENDERS", "", _parse_csv_lower),
+    ("gmail_max", "GMAIL_MAX", "5", _parse_int(5)),
+    ("days_ahead", "DAYS_AHEAD", "14", _parse_int(14)),
+    ("tz", "TZ", "Europe/Oslo", None),
+    ("openai_api_key", "OPENAI_API_KEY", None, None),
+    ("elevenlabs_api_key", "ELEVENLABS_API_KEY", None, None),
+    ("elevenlabs_voice_id", "ELEVENLABS_VOICE_ID", None, None),
+    ("elevenlabs_model_id", "ELEVENLABS_MODEL_ID", "eleven_multilingual_v2", None),
+    ("mock_elevenlabs", "MOCK_ELEVENLABS", "false", _parse_bool),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    mcp_server_url: str
+    mcp_server_url: Optional[str]
 
     slack_bot_token: Optional[str]
     slack_user_id: Optional[str]
@@ -38,74 +92,24 @@ class Settings:
     elevenlabs_model_id: Optional[str]
     mock_elevenlabs: bool
 
-    @staticmethod
-    def _strip_env(key: str, default: str | None = None) -> str | None:
-        """Get env var and strip whitespace/newlines (common issue with GitHub secrets)."""
-        val = os.getenv(key)
-        if val is None:
-            return default
-        stripped = val.strip()
-        return stripped if stripped else default
-
     @staticmethod
     def load() -> "Settings":
-        mcp_server_url = Settings._strip_env("MCP_SERVER_URL")
-        if not mcp_server_url:
-            raise ValueError("MCP_SERVER_URL environment variable is required")
-
-        slack_bot_token = Settings._strip_env("SLACK_BOT_TOKEN")
-        slack_user_id = Settings._strip_env("SLACK_USER_ID")
-        slack_fallback_channel = Settings._strip_env("SLACK_FALLBACK_CHANNEL")
-
-        notion_api_key = Settings._strip_env("NOTION_API_KEY")
-        notion_task_database_id = Settings._strip_env("NOTION_TASK_DATABASE_ID")
-
-        google_calendar_id = Settings._strip_env("GOOGLE_CALENDAR_ID") or "primary"
-        google_oauth_client_id = Settings._strip_env("GOOGLE_OAUTH_CLIENT_ID")
-        google_oauth_client_secret = Settings._strip_env("GOOGLE_OAUTH_CLIENT_SECRET")
-
-        gmail_query = Settings._strip_env("GMAIL_QUERY") or "label:INBOX newer_than:1d"
-        important_senders_str = Settings._strip_env("IMPORTANT_SENDERS") or ""
-        important_senders = [s.strip() for s in important_senders_str.split(",") if s.strip()]
-        gmail_max_str = Settings._strip_env("GMAIL_MAX") or "5"
-        try:
-            gmail_max = int(gmail_max_str)
-        except ValueError:
-            gmail_max = 5
-
-        days_ahead_str = Settings._strip_env("DAYS_AHEAD") or "14"
-        try:
-            days_ahead = int(days_ahead_str)
-        except ValueError:
-            days_ahead = 14
-        tz = Settings._strip_env("TZ") or "Europe/Oslo"
-
-        openai_api_key = Settings._strip_env("OPENAI_API_KEY")
-        elevenlabs_api_key = Settings._strip_env("ELEVENLABS_API_KEY")
-        elevenlabs_voice_id = Settings._strip_env("ELEVENLABS_VOICE_ID")
-        elevenlabs_model_id = Settings._strip_env("ELEVENLABS_MODEL_ID") or "eleven_multilingual_v2"
-        mock_elevenlabs = (Settings._strip_env("MOCK_ELEVENLABS") or "false").lower() in {"1", "true", "yes"}
-
-        return Settings(
-            mcp_server_url=mcp_server_url,
-            slack_bot_token=slack_bot_token,
-            slack_user_id=slack_user_id,
-            slack_fallback_channel=slack_fallback_channel,
-            notion_api_key=notion_api_key,
-            notion_task_database_id=notion_task_database_id,
-            google_calendar_id=google_calendar_id,
-            google_oauth_client_id=google_oauth_client_id,
-            google_oauth_client_secret=google_oauth_client_secret,
-            gmail_query=gmail_query,
-            important_senders=important_senders,
-            gmail_max=gmail_max,
-            days_ahead=days_ahead,
-            tz=tz,
-            openai_api_key=openai_api_key,
-            elevenlabs_api_key=elevenlabs_api_key,
-            elevenlabs_voice_id=elevenlabs_voice_id,
-            elevenlabs_model_id=elevenlabs_model_id,
-            mock_elevenlabs=mock_elevenlabs,
-        )
+        """Return the process-wide settings, parsing the environment on first use only."""
+        return _load_cached()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cached() -> Settings:
+    _ensure_dotenv()
 
+    env = os.environ
+    parsed: dict[str, Any] = {}
+    for field, key, default, coerce in _ENV_TABLE:
+        # Strip whitespace/newlines (common issue with GitHub secrets); blank counts as unset
+        raw = env.get(key)
+        val = raw.strip() if raw else None
+        if not val:
+            val = default
+        parsed[field] = coerce(val) if coerce is not None and val is not None else val
 
+    return Settings(**parsed)
@@ -5,19 +5,28 @@ Test script for Notion Area relation extraction - debug why areas aren't showing
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import reprlib
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from notion_client import Client
 
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger("test-notion-area")
 
+# Bounded repr for raw property previews: stops walking large relation lists early
+_PREVIEW = reprlib.Repr()
+_PREVIEW.maxlevel = 4
+_PREVIEW.maxdict = _PREVIEW.maxlist = 10
+_PREVIEW.maxstring = _PREVIEW.maxother = 200
+
 
 def main():
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
     api_key = os.getenv("NOTION_API_KEY")
     database_id = os.getenv("NOTION_TASK_DATABASE_ID")
     
@@ -37,14 +46,34 @@ def main():
     print("Fetching tasks...")
     print("=" * 80)
     
+    session = None
     try:
         # Try SDK method first, fallback to HTTP (same pattern as main code)
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         notion_headers = {
             "Authorization": f"Bearer {api_key}",
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json",
         }
+        # One session so HTTP fallbacks reuse the TLS connection; retries back
+        # off on Notion's rate limit (database queries are POST but read-only)
+        session = requests.Session()
+        session.headers.update(notion_headers)
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "POST"}),
+                ),
+            ),
+        )
         
         try:
             # Some SDK versions use query, others use query_database
@@ -57,20 +86,52 @@ def main():
         except (AttributeError, TypeError):
             # Fallback to direct HTTP
             url = f"https://api.notion.com/v1/databases/{database_id}/query"
-            resp = requests.post(url, headers=notion_headers, json={"page_size": 5}, timeout=30)
+            resp = session.post(url, json={"page_size": 5}, timeout=30)
             resp.raise_for_status()
             result = resp.json()
         tasks = result.get("results", [])
         print(f"\nFound {len(tasks)} tasks\n")
         
-        for i, task in enumerate(tasks, 1):
+        # Find the title and Area relation properties of each task in a single pass
+        task_props = []
+        related_ids = []
+        for task in tasks:
             props = task.get("properties", {})
-            name_prop = None
+            name_prop = area_prop = None
             for pname, pdata in props.items():
-                if pdata.get("type") == "title":
+                ptype = pdata.get("type")
+                if ptype == "title" and name_prop is None:
                     name_prop = pname
+                elif ptype == "relation" and area_prop is None and pname.lower() == "area":
+                    area_prop = pname
+                if name_prop and area_prop:
                     break
-            
+            task_props.append((props, name_prop, area_prop))
+            if area_prop:
+                relation_arr = props[area_prop].get("relation", [])
+                if relation_arr:
+                    related_ids.append(relation_arr[0].get("id"))
+
+        def retrieve_page(page_id):
+            try:
+                try:
+                    return client.pages.retrieve(page_id=page_id)
+                except (AttributeError, TypeError):
+                    # Fallback to direct HTTP
+                    resp = session.get(f"https://api.notion.com/v1/pages/{page_id}", timeout=30)
+                    resp.raise_for_status()
+                    return resp.json()
+            except Exception as e:  # noqa: BLE001
+                return e
+
+        # Fetch all related Area pages concurrently instead of one round trip per task
+        unique_ids = list(dict.fromkeys(related_ids))
+        related_pages = {}
+        if unique_ids:
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                related_pages = dict(zip(unique_ids, ex.map(retrieve_page, unique_ids)))
+
+        for i, (task, (props, name_prop, area_prop)) in enumerate(zip(tasks, task_props), 1):
             # Safely extract task name
             if name_prop:
                 title_arr = props.get(name_prop, {}).get("title", [])
@@ -82,12 +143,6 @@ def main():
             print(f"    Task ID: {task.get('id')}")
             
             # Check Area property
-            area_prop = None
-            for pname, pdata in props.items():
-                if pdata.get("type") == "relation" and pname.lower() == "area":
-                    area_prop = pname
-                    break
-            
             if not area_prop:
                 print("    ❌ No 'Area' relation property found!")
                 print(f"    Available properties: {list(props.keys())}")
@@ -97,16 +152,18 @@ def main():
                 relation_arr = area_data.get("relation", [])
                 print(f"    ✅ Found Area property: '{area_prop}'")
                 print(f"    Relation array length: {len(relation_arr)}")
-                print(f"    Raw Area property data: {json.dumps(area_data, indent=6)[:500]}")
+                print(f"    Raw Area property data: {_PREVIEW.repr(area_data)[:500]}")
                 
                 if relation_arr:
                     print(f"    ✅ Task HAS Area relation!")
                     related_page_id = relation_arr[0].get("id")
                     print(f"    Related page ID: {related_page_id}")
                     
-                    # Fetch the related page
+                    # Look up the prefetched related page
                     try:
-                        related_page = client.pages.retrieve(page_id=related_page_id)
+                        related_page = related_pages[related_page_id]
+                        if isinstance(related_page, Exception):
+                            raise related_page
                         related_props = related_page.get("properties", {})
                         print(f"    ✅ Successfully fetched related page")
                         
@@ -134,6 +191,9 @@ def main():
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if session is not None:
+            session.close()
 
 
 if __name__ == "__main__":
@@ -1,134 +1,138 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict
 
 from src.config import Settings
-from src.models.calendar_models import CalendarEvent
-from src.models.email_models import Email
-from src.models.task_models import Task
-from src.mcp_client import MCPClient
+from src.mcp_client import AsyncMCPClient, MCPClient, iter_base64_decoded
 from src.summarizer import make_summary
-from src.utils.dates import today_range_iso, weekday_name, pretty_time
+from src.utils.dates import get_timezone, time_and_weekday, today_range_iso
 
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger("morning-brief-assistant")
 
 
-def _safe_fetch_calendar(mcp_client: MCPClient, settings: Settings, start_iso: str, end_iso: str) -> List[CalendarEvent]:
-    try:
-        return mcp_client.get_calendar_events(settings.google_calendar_id, start_iso, end_iso)
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Calendar provider failed: %s", exc)
-        return []
-
-
-def _safe_fetch_gmail(mcp_client: MCPClient, settings: Settings) -> List[Email]:
-    try:
-        return mcp_client.get_gmail_messages(settings.gmail_query, settings.important_senders, settings.gmail_max)
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Gmail provider failed: %s", exc)
-        return []
+async def _fetch_all(settings: Settings, today_start: str, today_end: str) -> Dict[str, Any]:
+    """Fetch calendar, Gmail and Notion concurrently; a failing provider leaves its result empty."""
+    results: Dict[str, Any] = {
+        "today_events": [],
+        "emails": [],
+        "tasks_today": [],
+    }
+    notion_args = None
+    if settings.notion_api_key and settings.notion_task_database_id:
+        notion_args = {
+            "api_key": settings.notion_api_key,
+            "database_id": settings.notion_task_database_id,
+            "today_start_iso": today_start,
+            "today_end_iso": today_end,
+            "days_ahead": settings.days_ahead,
+            "tz": settings.tz,
+        }
+    async with AsyncMCPClient(settings.mcp_server_url) as client:
+        events, emails, notion = await client.fetch_all(
+            calendar_id=settings.google_calendar_id,
+            time_min=today_start,
+            time_max=today_end,
+            gmail_query=settings.gmail_query,
+            important_senders=settings.important_senders,
+            gmail_max=settings.gmail_max,
+            notion_args=notion_args,
+        )
+    for key, provider, val in (
+        ("today_events", "Calendar", events),
+        ("emails", "Gmail", emails),
+        ("notion", "Notion", notion),
+    ):
+        if isinstance(val, Exception):
+            logger.error("%s provider failed: %s", provider, val)
+        elif key == "notion":
+            t_today, _t_overdue, _t_upcoming = val
+            results["tasks_today"] = t_today
+        else:
+            results[key] = val
+    return results
 
 
-def _safe_fetch_notion(mcp_client: MCPClient, settings: Settings, today_start: str, today_end: str) -> Tuple[List[Task], List[Task], List[Task]]:
-    try:
-        if not settings.notion_api_key or not settings.notion_task_database_id:
-            return [], [], []
-        return mcp_client.get_notion_tasks(
-            settings.notion_api_key,
-            settings.notion_task_database_id,
-            today_start,
-            today_end,
-            settings.days_ahead,
-            settings.tz,
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Notion provider failed: %s", exc)
-        return [], [], []
+def _post_summary(mcp_client: MCPClient, settings: Settings, summary: str) -> bool:
+    """Post the text summary as a DM, falling back to the configured channel."""
+    posted = False
+    if settings.slack_user_id:
+        posted = mcp_client.post_to_slack(user_id=settings.slack_user_id, text=summary)
+    if not posted and settings.slack_fallback_channel:
+        posted = mcp_client.post_to_slack(channel=settings.slack_fallback_channel, text=summary)
+    return posted
 
 
 def main() -> int:
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
     settings = Settings.load()
     mcp_client = MCPClient(settings.mcp_server_url)
 
     today_start, today_end = today_range_iso(settings.tz)
 
     # Fetch concurrently where possible
-    futures = {}
-    with ThreadPoolExecutor(max_workers=4) as pool:
-        futures[pool.submit(_safe_fetch_calendar, mcp_client, settings, today_start, today_end)] = "today_events"
-        futures[pool.submit(_safe_fetch_gmail, mcp_client, settings)] = "emails"
-        futures[pool.submit(_safe_fetch_notion, mcp_client, settings, today_start, today_end)] = "notion"
-
-        results = {
-            "today_events": [],
-            "emails": [],
-            "tasks_today": [],
-        }
-        for f in as_completed(futures):
-            key = futures[f]
-            try:
-                val = f.result()
-            except Exception as exc:  # noqa: BLE001
-                logger.error("Fetch failed for %s: %s", key, exc)
-                continue
-            if key == "notion":
-                t_today, _t_overdue, _t_upcoming = val
-                results["tasks_today"] = t_today
-            else:
-                results[key] = val
+    results = asyncio.run(_fetch_all(settings, today_start, today_end))
+    today_events, tasks_today, emails = results["today_events"], results["tasks_today"], results["emails"]
 
     summary = make_summary(
         tz=settings.tz,
-        today_events=results["today_events"],
-        tasks_today=results["tasks_today"],
-        emails=results["emails"],
+        today_events=today_events,
+        tasks_today=tasks_today,
+        emails=emails,
     )
 
     print(summary)
 
-    posted = False
-    if settings.slack_user_id:
-        posted = mcp_client.post_to_slack(user_id=settings.slack_user_id, text=summary)
-    if not posted and settings.slack_fallback_channel:
-        posted = mcp_client.post_to_slack(channel=settings.slack_fallback_channel, text=summary)
+    # The text post runs alongside voice script generation and synthesis,
+    # which don't depend on it
+    post_pool = ThreadPoolExecutor(max_workers=1)
+    post_future = post_pool.submit(_post_summary, mcp_client, settings, summary)
     # Try ElevenLabs TTS and upload audio, but do not fail the run if it breaks
     try:
-        from pathlib import Path
-
         # If OPENAI_API_KEY is present, generate a warmer voice script from structured data
         voice_text = None
-        if settings.openai_api_key:
+        if not (today_events or tasks_today or emails):
+            # Nothing worth reading out; skip the OpenAI and ElevenLabs calls entirely
+            logger.info("Nothing on the agenda today, skipping the voice brief")
+        elif settings.openai_api_key:
             # Prepare structured data for the LLM - EXCLUDE done tasks
-            today_events_llm = [
-                {
-                    "title": e.title,
-                    "time": ("All day" if e.all_day else pretty_time(e.start_iso, settings.tz)),
-                    "weekday": ("" if e.all_day else weekday_name(e.start_iso, settings.tz)),
-                    "location": e.location,
-                    "link": e.meeting_link,
-                }
-                for e in results["today_events"]
-            ]
+            # Resolve the timezone once and parse each start time a single time
+            tz_obj = get_timezone(settings.tz)
+            today_events_llm = []
+            for e in today_events:
+                if e.all_day:
+                    time_str, weekday = "All day", ""
+                else:
+                    time_str, weekday = time_and_weekday(e.start_iso, tz_obj)
+                today_events_llm.append(
+                    {
+                        "title": e.title,
+                        "time": time_str,
+                        "weekday": weekday,
+                        "location": e.location,
+                        "link": e.meeting_link,
+                    }
+                )
             # Filter out done tasks BEFORE sending to LLM
             tasks_today_llm = [
                 {"name": t.name, "area": t.area}
-                for t in results["tasks_today"]
+                for t in tasks_today
                 if not t.done
             ]
             # Log area distribution for debugging
-            area_counts = {}
-            for t in tasks_today_llm:
-                area = t.get("area") or "None"
-                area_counts[area] = area_counts.get(area, 0) + 1
-            logger.info("Tasks by area for LLM: %s", area_counts)
+            area_counts = Counter(t["area"] or "None" for t in tasks_today_llm)
+            logger.info("Tasks by area for LLM: %s", dict(area_counts))
             emails_llm = [
                 {"from": (e.from_name or e.from_email or ""), "subject": (e.subject or "")}
-                for e in results["emails"][:3]
+                for e in islice(emails, 3)
             ]
             logger.info("Generating voice script with OpenAI (today events: %d, tasks: %d, emails: %d)", len(today_events_llm), len(tasks_today_llm), len(emails_llm))
             voice_text = mcp_client.generate_voice_script(
@@ -147,24 +151,33 @@ def main() -> int:
             voice_text = summary  # Fallback to summary text
 
         if voice_text and not settings.mock_elevenlabs:
-            # Synthesize speech using ElevenLabs via MCP
-            audio_data = mcp_client.synthesize_speech(
+            from pathlib import Path
+
+            # The MCP response already carries the MP3 base64-encoded, so it is
+            # forwarded to Slack as is instead of being decoded to disk and
+            # re-encoded from the file
+            outfile = Path("out/audio/daily-brief.mp3")
+            audio_b64 = mcp_client.synthesize_speech_base64(
                 text=voice_text,
                 voice_id=settings.elevenlabs_voice_id,
                 model_id=settings.elevenlabs_model_id,
             )
-            # Save audio file
-            outfile = Path("out/audio/daily-brief.mp3")
+
+            # Keep a local copy before uploading so a failed upload still leaves
+            # the audio on disk; a large buffer turns the chunked writes into a few syscalls
             outfile.parent.mkdir(parents=True, exist_ok=True)
-            with open(outfile, "wb") as f:
-                f.write(audio_data)
+            with open(outfile, "wb", buffering=1 << 20) as f:
+                for chunk in iter_base64_decoded(audio_b64):
+                    f.write(chunk)
             logger.info("Audio file saved to %s", outfile)
 
-            # Upload to Slack
+            # Upload to Slack once the text post has landed so the DM reads in order
             if settings.slack_user_id:
-                mcp_client.upload_file_to_slack(
+                wait([post_future])
+                mcp_client.upload_base64_to_slack(
                     user_id=settings.slack_user_id,
-                    file_path=str(outfile),
+                    file_data=audio_b64,
+                    filename=outfile.name,
                     title="Daily Brief (Audio)",
                     initial_comment="🔊 Here's your morning audio summary.",
                 )
@@ -173,6 +186,10 @@ def main() -> int:
     except Exception as exc:  # noqa: BLE001
         logger.warning("ElevenLabs TTS failed: %s", exc)
 
+    try:
+        posted = post_future.result()
+    finally:
+        post_pool.shutdown()
     mcp_client.close()
 
     if not posted:
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, Iterator, List, Dict, Any, Optional, Union
 import httpx
+import msgspec
+
+try:
+    # SIMD-accelerated drop-in for the stdlib module
+    import pybase64 as base64
+except ImportError:  # pragma: no cover
+    import base64
 
 from src.models.calendar_models import CalendarEvent
 from src.models.email_models import Email
@@ -11,55 +20,100 @@ from src.models.task_models import Task
 
 logger = logging.getLogger(__name__)
 
+# Raw bytes per chunk when streaming binary data through base64; a multiple of 3
+# so each slice encodes/decodes on its own.
+_B64_CHUNK = 48 * 1024
 
-class MCPClient:
-    """HTTP client for Vercel-hosted MCP server."""
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Keep-alive pool shared by every MCP request; all tool calls go to one host
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=60.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _pooled_client(server_url: str, timeout: int) -> httpx.Client:
+    """Process-wide HTTP/2 client per (server, timeout) so repeated MCPClients reuse connections."""
+    client = httpx.Client(
+        timeout=timeout,
+        transport=httpx.HTTPTransport(http2=True, limits=_POOL_LIMITS, retries=2),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def iter_base64_decoded(encoded: str, chunk_size: int = _B64_CHUNK) -> Iterator[bytes]:
+    """Decode a base64 string in chunks of ``chunk_size`` bytes."""
+    step = (chunk_size // 3) * 4
+    for i in range(0, len(encoded), step):
+        yield base64.b64decode(encoded[i : i + step])
+
+
+class _NotionTasks(msgspec.Struct):
+    today: List[Task] = []
+    overdue: List[Task] = []
+    upcoming: List[Task] = []
 
-    def __init__(self, server_url: str, timeout: int = 60):
+
+class _MCPClientBase:
+    """Request building and response decoding shared by the sync and async clients."""
+
+    def __init__(self, server_url: Optional[str], timeout: int = 60):
         """
         Initialize MCP client.
 
         Args:
             server_url: Base URL of the Vercel MCP server (e.g., https://your-server.vercel.app/api/mcp)
             timeout: Request timeout in seconds
+
+        Raises:
+            ValueError: If no server URL is configured.
         """
+        if not server_url:
+            raise ValueError("MCP_SERVER_URL environment variable is required")
         self.server_url = server_url.rstrip("/")
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
 
-    def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call an MCP tool via HTTP."""
-        try:
-            response = self.client.post(
-                self.server_url,
-                json={
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments,
-                    },
+    @staticmethod
+    def _tool_request_body(tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        return msgspec.json.encode(
+            {
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments,
                 },
-            )
+            }
+        )
+
+    @classmethod
+    def _tool_request_stream(
+        cls, tool_name: str, arguments: Dict[str, Any], field: str, fileobj: BinaryIO
+    ) -> Iterator[bytes]:
+        """Yield a tool request body with ``fileobj`` base64-encoded into ``field`` as it is read."""
+        body = cls._tool_request_body(tool_name, {**arguments, field: ""})
+        # The streamed field is serialized last, so the body ends with '""}}}'
+        yield body[:-4]
+        for chunk in iter(lambda: fileobj.read(_B64_CHUNK), b""):
+            yield base64.b64encode(chunk)
+        yield body[-4:]
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> Dict[str, Any]:
+        """Raise on HTTP/MCP errors and return the tool result."""
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            error_body = ""
             try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                error_body = ""
-                try:
-                    error_body = e.response.text
-                except Exception:  # noqa: BLE001
-                    error_body = "<unable to read body>"
-                logger.error("MCP HTTP error (%s): %s", e, error_body)
-                raise
-            data = response.json()
-            if "error" in data:
-                raise RuntimeError(f"MCP server error: {data['error']}")
-            return data.get("result", {})
-        except httpx.HTTPError as e:
-            logger.error("MCP HTTP error: %s", e)
-            raise
-        except Exception as e:
-            logger.error("MCP call failed: %s", e)
+                error_body = e.response.text
+            except Exception:  # noqa: BLE001
+                error_body = "<unable to read body>"
+            logger.error("MCP HTTP error (%s): %s", e, error_body)
             raise
+        data = msgspec.json.decode(response.content)
+        if "error" in data:
+            raise RuntimeError(f"MCP server error: {data['error']}")
+        return data.get("result", {})
 
     def _extract_text_content(self, result: Dict[str, Any]) -> str:
         """Extract text content from MCP result."""
@@ -69,17 +123,55 @@ class MCPClient:
                 return item.get("text", "")
         return ""
 
-    def _extract_data_content(self, result: Dict[str, Any]) -> tuple[bytes, str]:
-        """Extract binary data content from MCP result."""
+    def _extract_data_base64(self, result: Dict[str, Any]) -> tuple[str, str]:
+        """Extract still-encoded binary data content and its MIME type from MCP result."""
         content = result.get("content", [])
         for item in content:
             if item.get("type") == "data":
-                import base64
-                data = base64.b64decode(item.get("data", ""))
-                mime_type = item.get("mimeType", "application/octet-stream")
-                return data, mime_type
+                return item.get("data", ""), item.get("mimeType", "application/octet-stream")
         raise ValueError("No data content found in MCP result")
 
+    def _extract_data_content(self, result: Dict[str, Any]) -> tuple[bytes, str]:
+        """Extract binary data content from MCP result."""
+        encoded, mime_type = self._extract_data_base64(result)
+        return base64.b64decode(encoded), mime_type
+
+    # Tool payloads are decoded straight from JSON into typed models in one pass
+
+    def _parse_calendar_events(self, result: Dict[str, Any]) -> List[CalendarEvent]:
+        return msgspec.json.decode(self._extract_text_content(result), type=List[CalendarEvent], strict=False)
+
+    def _parse_emails(self, result: Dict[str, Any]) -> List[Email]:
+        return msgspec.json.decode(self._extract_text_content(result), type=List[Email], strict=False)
+
+    def _parse_notion_tasks(self, result: Dict[str, Any]) -> tuple[List[Task], List[Task], List[Task]]:
+        tasks = msgspec.json.decode(self._extract_text_content(result), type=_NotionTasks, strict=False)
+        return tasks.today, tasks.overdue, tasks.upcoming
+
+
+class MCPClient(_MCPClientBase):
+    """HTTP client for Vercel-hosted MCP server."""
+
+    def __init__(self, server_url: Optional[str], timeout: int = 60):
+        super().__init__(server_url, timeout)
+        self.client = _pooled_client(self.server_url, timeout)
+
+    def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call an MCP tool via HTTP."""
+        return self._post(self._tool_request_body(tool_name, arguments))
+
+    def _post(self, content: Union[bytes, Iterator[bytes]]) -> Dict[str, Any]:
+        """POST a tool request body (bytes or a chunk iterator) and return the tool result."""
+        try:
+            response = self.client.post(self.server_url, content=content, headers=_JSON_HEADERS)
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            logger.error("MCP HTTP error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("MCP call failed: %s", e)
+            raise
+
     def get_calendar_events(
         self, calendar_id: str, time_min: str, time_max: str
     ) -> List[CalendarEvent]:
@@ -92,9 +184,7 @@ class MCPClient:
                 "time_max": time_max,
             },
         )
-        text = self._extract_text_content(result)
-        events_data = json.loads(text)
-        return [CalendarEvent(**event) for event in events_data]
+        return self._parse_calendar_events(result)
 
     def get_gmail_messages(
         self, query: str, important_senders: List[str], max_results: int
@@ -108,9 +198,7 @@ class MCPClient:
                 "max_results": max_results,
             },
         )
-        text = self._extract_text_content(result)
-        emails_data = json.loads(text)
-        return [Email(**email) for email in emails_data]
+        return self._parse_emails(result)
 
     def get_notion_tasks(
         self,
@@ -133,12 +221,7 @@ class MCPClient:
                 "tz": tz,
             },
         )
-        text = self._extract_text_content(result)
-        tasks_data = json.loads(text)
-        today = [Task(**task) for task in tasks_data.get("today", [])]
-        overdue = [Task(**task) for task in tasks_data.get("overdue", [])]
-        upcoming = [Task(**task) for task in tasks_data.get("upcoming", [])]
-        return today, overdue, upcoming
+        return self._parse_notion_tasks(result)
 
     def generate_voice_script(
         self,
@@ -176,6 +259,21 @@ class MCPClient:
         audio_data, _ = self._extract_data_content(result)
         return audio_data
 
+    def synthesize_speech_base64(
+        self, text: str, voice_id: Optional[str] = None, model_id: Optional[str] = None
+    ) -> str:
+        """Synthesize speech using ElevenLabs. Returns the MP3 audio still base64-encoded."""
+        result = self._call_tool(
+            "synthesize_speech",
+            {
+                "text": text,
+                "voice_id": voice_id,
+                "model_id": model_id,
+            },
+        )
+        audio_b64, _ = self._extract_data_base64(result)
+        return audio_b64
+
     def post_to_slack(
         self, user_id: Optional[str] = None, channel: Optional[str] = None, text: str = ""
     ) -> bool:
@@ -189,7 +287,7 @@ class MCPClient:
             },
         )
         text_content = self._extract_text_content(result)
-        result_data = json.loads(text_content)
+        result_data = msgspec.json.decode(text_content)
         return result_data.get("success", False)
 
     def upload_file_to_slack(
@@ -200,33 +298,57 @@ class MCPClient:
         initial_comment: Optional[str] = None,
     ) -> bool:
         """Upload a file to Slack."""
-        import base64
         from pathlib import Path
 
         file_path_obj = Path(file_path)
         if not file_path_obj.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # Stream the file through base64 straight into the request body rather
+        # than holding the raw and encoded copies in memory at once
         with open(file_path_obj, "rb") as f:
-            file_data = base64.b64encode(f.read()).decode("utf-8")
+            result = self._post(
+                self._tool_request_stream(
+                    "upload_file_to_slack",
+                    {
+                        "user_id": user_id,
+                        "filename": file_path_obj.name,
+                        "title": title,
+                        "initial_comment": initial_comment,
+                    },
+                    "file_data",
+                    f,
+                )
+            )
+        text_content = self._extract_text_content(result)
+        result_data = msgspec.json.decode(text_content)
+        return result_data.get("success", False)
 
+    def upload_base64_to_slack(
+        self,
+        user_id: str,
+        file_data: str,
+        filename: str,
+        title: str,
+        initial_comment: Optional[str] = None,
+    ) -> bool:
+        """Upload already base64-encoded file data to Slack."""
         result = self._call_tool(
             "upload_file_to_slack",
             {
                 "user_id": user_id,
                 "file_data": file_data,
-                "filename": file_path_obj.name,
+                "filename": filename,
                 "title": title,
                 "initial_comment": initial_comment,
             },
         )
         text_content = self._extract_text_content(result)
-        result_data = json.loads(text_content)
+        result_data = msgspec.json.decode(text_content)
         return result_data.get("success", False)
 
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Release the client. The pooled connections stay open for reuse until interpreter exit."""
 
     def __enter__(self):
         return self
@@ -234,3 +356,119 @@ class MCPClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+
+class AsyncMCPClient(_MCPClientBase):
+    """Async variant of MCPClient for issuing the independent fetch tools concurrently."""
+
+    def __init__(self, server_url: Optional[str], timeout: int = 60):
+        super().__init__(server_url, timeout)
+        self.client = httpx.AsyncClient(timeout=timeout, http2=True, limits=_POOL_LIMITS)
+
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call an MCP tool via HTTP."""
+        try:
+            response = await self.client.post(
+                self.server_url,
+                content=self._tool_request_body(tool_name, arguments),
+                headers=_JSON_HEADERS,
+            )
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            logger.error("MCP HTTP error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("MCP call failed: %s", e)
+            raise
+
+    async def get_calendar_events(
+        self, calendar_id: str, time_min: str, time_max: str
+    ) -> List[CalendarEvent]:
+        """Fetch calendar events from Google Calendar."""
+        result = await self._call_tool(
+            "get_calendar_events",
+            {
+                "calendar_id": calendar_id,
+                "time_min": time_min,
+                "time_max": time_max,
+            },
+        )
+        return self._parse_calendar_events(result)
+
+    async def get_gmail_messages(
+        self, query: str, important_senders: List[str], max_results: int
+    ) -> List[Email]:
+        """Search and fetch Gmail messages."""
+        result = await self._call_tool(
+            "get_gmail_messages",
+            {
+                "query": query,
+                "important_senders": important_senders,
+                "max_results": max_results,
+            },
+        )
+        return self._parse_emails(result)
+
+    async def get_notion_tasks(
+        self,
+        api_key: str,
+        database_id: str,
+        today_start_iso: str,
+        today_end_iso: str,
+        days_ahead: int,
+        tz: str,
+    ) -> tuple[List[Task], List[Task], List[Task]]:
+        """Query Notion tasks (returns today, overdue, upcoming)."""
+        result = await self._call_tool(
+            "get_notion_tasks",
+            {
+                "api_key": api_key,
+                "database_id": database_id,
+                "today_start_iso": today_start_iso,
+                "today_end_iso": today_end_iso,
+                "days_ahead": days_ahead,
+                "tz": tz,
+            },
+        )
+        return self._parse_notion_tasks(result)
+
+    async def fetch_all(
+        self,
+        calendar_id: str,
+        time_min: str,
+        time_max: str,
+        gmail_query: str,
+        important_senders: List[str],
+        gmail_max: int,
+        notion_args: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        Fetch calendar events, Gmail messages and Notion tasks concurrently.
+
+        Args:
+            notion_args: Keyword arguments for get_notion_tasks; Notion is skipped
+                (empty today/overdue/upcoming) when None.
+
+        Returns:
+            [events, emails, (today, overdue, upcoming)], with a failed fetch
+            returned as its exception instead of being raised.
+        """
+
+        async def no_tasks() -> tuple[List[Task], List[Task], List[Task]]:
+            return [], [], []
+
+        return await asyncio.gather(
+            self.get_calendar_events(calendar_id, time_min, time_max),
+            self.get_gmail_messages(gmail_query, important_senders, gmail_max),
+            self.get_notion_tasks(**notion_args) if notion_args else no_tasks(),
+            return_exceptions=True,
+        )
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
-class CalendarEvent(BaseModel):
+class CalendarEvent(msgspec.Struct, frozen=True):
     id: str
     title: str
     start_iso: str
     end_iso: str
-    all_day: bool = Field(default=False)
+    all_day: bool = False
     location: Optional[str] = None
     meeting_link: Optional[str] = None
 
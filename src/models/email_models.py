@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel
+import msgspec
 
 
-class Email(BaseModel):
+class Email(msgspec.Struct, frozen=True):
     id: str
     thread_id: Optional[str] = None
     from_name: Optional[str] = None
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel
+import msgspec
 
 
-class Task(BaseModel):
+class Task(msgspec.Struct, frozen=True):
     id: str
     name: str
     due_iso: Optional[str] = None
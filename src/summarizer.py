@@ -1,32 +1,40 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.models.calendar_models import CalendarEvent
 from src.models.email_models import Email
 from src.models.task_models import Task
-from src.utils.dates import pretty_day_header, pretty_time
-from src.utils.formatting import section
+from src.utils.dates import get_timezone, pretty_day_header, pretty_time, pretty_time_aware
+from src.utils.formatting import INBOX_TITLE, TASKS_TODAY_TITLE, TODAY_TITLE, section
+
+_ARROW = " → "
+_BACK_TO_BACK = " (back-to-back — plan travel buffer)"
 
 
 def _events_lines(events: List[CalendarEvent], tz: str) -> List[str]:
     lines: List[str] = []
-    # Back-to-back detection
+    tz_obj = get_timezone(tz)
+    # Back-to-back detection against the previous event's end, which is only
+    # formatted when the raw timestamps differ
     events_sorted = sorted(events, key=lambda e: e.start_iso)
-    for idx, e in enumerate(events_sorted):
+    prev_end: Optional[str] = None
+    for e in events_sorted:
         if e.all_day:
             start_str = "All day"
         else:
-            start_str = pretty_time(e.start_iso, tz)
+            # Timed events come from Google's dateTime, which always has an offset
+            start_str = pretty_time_aware(e.start_iso, tz_obj)
+        parts = [start_str, _ARROW, e.title]
         loc_part = e.location or e.meeting_link
-        loc = f" → {loc_part}" if loc_part else ""
-        lines.append(f"{start_str} → {e.title}{loc}")
-        if idx > 0 and not e.all_day:
-            # simplistic back-to-back hint
-            prev_end = events_sorted[idx - 1].end_iso
-            if prev_end and pretty_time(prev_end, tz) == start_str:
-                lines[-1] += " (back-to-back — plan travel buffer)"
+        if loc_part:
+            parts += (_ARROW, loc_part)
+        # simplistic back-to-back hint
+        if not e.all_day and prev_end and (prev_end == e.start_iso or pretty_time(prev_end, tz_obj) == start_str):
+            parts.append(_BACK_TO_BACK)
+        lines.append("".join(parts))
+        prev_end = e.end_iso
     return lines
 
 
@@ -60,13 +68,15 @@ def make_summary(
     emails: List[Email],
 ) -> str:
     header = f"Good morning, Oliver — {pretty_day_header(tz)}"
+    if not (today_events or tasks_today or emails):
+        return f"{header}\n\nNothing on the agenda today."
 
-    today_sec = section("🗓️ Today", _events_lines(today_events, tz))
+    today_sec = section(TODAY_TITLE, _events_lines(today_events, tz))
     tasks_today_lines, _ = _tasks_lines(tasks_today, [])
-    tasks_today_sec = section("🧰 Tasks Today", tasks_today_lines)
-    inbox_sec = section("📥 Inbox Today", _emails_lines(emails))
+    tasks_today_sec = section(TASKS_TODAY_TITLE, tasks_today_lines)
+    inbox_sec = section(INBOX_TITLE, _emails_lines(emails))
 
-    parts = [header, "", today_sec, "", tasks_today_sec, "", inbox_sec]
-    return "\n".join(p for p in parts if p is not None)
+    sections = [header, today_sec, tasks_today_sec, inbox_sec]
+    return "\n\n".join(s for s in sections if s is not None)
 
 
@@ -1,51 +1,75 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Tuple
+import functools
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Tuple, Union
+from zoneinfo import ZoneInfo
 
-import pytz
+# English day names indexed by datetime.weekday(), independent of LC_TIME
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 
-def get_timezone(tz_name: str) -> pytz.BaseTzInfo:
-    return pytz.timezone(tz_name)
+@functools.lru_cache(maxsize=8)
+def get_timezone(tz_name: str) -> ZoneInfo:
+    """Resolve a timezone name once per process."""
+    return ZoneInfo(tz_name)
 
 
 def today_range_iso(tz_name: str) -> Tuple[str, str]:
-    tz = get_timezone(tz_name)
-    now = datetime.now(tz)
-    start = tz.localize(datetime(now.year, now.month, now.day, 0, 0, 0))
-    end = start + timedelta(days=1)
-    return start.isoformat(), end.isoformat()
+    return _range_iso(tz_name, datetime.now(get_timezone(tz_name)).date(), 1)
 
 
 def next_n_days_range_iso(tz_name: str, days: int) -> Tuple[str, str]:
-    tz = get_timezone(tz_name)
-    now = datetime.now(tz)
-    start = tz.localize(datetime(now.year, now.month, now.day, 0, 0, 0))
+    return _range_iso(tz_name, datetime.now(get_timezone(tz_name)).date(), days)
+
+
+@functools.lru_cache(maxsize=8)
+def _range_iso(tz_name: str, day: date, days: int) -> Tuple[str, str]:
+    """Local-midnight window of ``days`` days starting at ``day``, as ISO strings."""
+    start = datetime(day.year, day.month, day.day, tzinfo=get_timezone(tz_name))
     end = start + timedelta(days=days)
     return start.isoformat(), end.isoformat()
 
 
 def pretty_day_header(tz_name: str) -> str:
     tz = get_timezone(tz_name)
-    now = datetime.now(tz)
+    return _day_header(datetime.now(tz).date())
+
+
+@functools.lru_cache(maxsize=8)
+def _day_header(day: date) -> str:
     # Example: Mon 3 Nov
-    return now.strftime("%a %-d %b") if hasattr(now, "strftime") else now.strftime("%a %d %b")
+    return day.strftime("%a %-d %b") if hasattr(day, "strftime") else day.strftime("%a %d %b")
 
 
-def pretty_time(dt_iso: str, tz_name: str) -> str:
-    tz = get_timezone(tz_name)
+def to_local_datetime(dt_iso: str, tz: Union[str, tzinfo]) -> datetime:
+    """Parse an ISO timestamp once and convert it to ``tz`` (a name or a resolved timezone)."""
+    if isinstance(tz, str):
+        tz = get_timezone(tz)
     dt = datetime.fromisoformat(dt_iso)
     if dt.tzinfo is None:
-        dt = tz.localize(dt)
-    return dt.astimezone(tz).strftime("%H:%M")
+        dt = dt.replace(tzinfo=tz)
+    return dt.astimezone(tz)
 
 
-def weekday_name(dt_iso: str, tz_name: str) -> str:
-    tz = get_timezone(tz_name)
-    dt = datetime.fromisoformat(dt_iso)
-    if dt.tzinfo is None:
-        dt = tz.localize(dt)
-    return dt.astimezone(tz).strftime("%A")
+def _clock(dt: datetime) -> str:
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def pretty_time(dt_iso: str, tz: Union[str, tzinfo]) -> str:
+    return _clock(to_local_datetime(dt_iso, tz))
+
+
+def pretty_time_aware(dt_iso: str, tz: tzinfo) -> str:
+    """``pretty_time`` for timestamps that always carry an offset, such as timed calendar events."""
+    return _clock(datetime.fromisoformat(dt_iso).astimezone(tz))
+
+
+def weekday_name(dt_iso: str, tz: Union[str, tzinfo]) -> str:
+    return _WEEKDAYS[to_local_datetime(dt_iso, tz).weekday()]
 
 
+def time_and_weekday(dt_iso: str, tz: Union[str, tzinfo]) -> Tuple[str, str]:
+    """``pretty_time`` and ``weekday_name`` of one timestamp, parsed once."""
+    dt = to_local_datetime(dt_iso, tz)
+    return _clock(dt), _WEEKDAYS[dt.weekday()]
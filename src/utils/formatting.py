@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 
 def truncate(text: str, max_len: int = 120) -> str:
     if len(text) <= max_len:
         return text
-    return text[: max_len - 1].rstrip() + "…"
+    return f"{text[: max_len - 1].rstrip()}…"
 
 
 def bulletize(lines: Iterable[str]) -> str:
     return "\n".join(f"• {line}" for line in lines if line)
 
 
-def section(title: str, lines: List[str]) -> str:
-    body = bulletize([truncate(l) for l in lines if l]) if lines else "(none)"
-    return f"{title}\n{body}" if body else title
+# Section titles of the brief; each gets its "title\n" prefix bound once
+TODAY_TITLE = "🗓️ Today"
+TASKS_TODAY_TITLE = "🧰 Tasks Today"
+INBOX_TITLE = "📥 Inbox Today"
+_SECTION_FMTS = {title: (title + "\n").__add__ for title in (TODAY_TITLE, TASKS_TODAY_TITLE, INBOX_TITLE)}
+
+
+def section(title: str, lines: List[str]) -> Optional[str]:
+    """Title plus bulleted lines, or None when there is nothing to list."""
+    body = bulletize(truncate(l) for l in lines if l)
+    if not body:
+        return None
+    fmt = _SECTION_FMTS.get(title)
+    return fmt(body) if fmt else f"{title}\n{body}"
 
 